@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _make_ohlc(
+    start: str = "2024-01-01", periods: int = 2000, tz: str = "Europe/Moscow"
+) -> pd.DataFrame:
+    """Random-walk 15-minute OHLC bars, deterministic across calls."""
+    rng = np.random.default_rng(0)
+    close = 1 + np.cumsum(rng.normal(0, 0.001, periods))
+    open_ = np.r_[close[0], close[:-1]]
+    idx = pd.date_range(start, periods=periods, freq="15min", tz=tz)
+    return pd.DataFrame(
+        {
+            "Open": open_,
+            "High": np.maximum(open_, close) + rng.random(periods) * 0.001,
+            "Low": np.minimum(open_, close) - rng.random(periods) * 0.001,
+            "Close": close,
+        },
+        index=idx,
+    )
+
+
+@pytest.fixture
+def make_ohlc():
+    return _make_ohlc
@@ -1,3 +1,5 @@
+from datetime import timedelta, timezone
+
 import pandas as pd
 
 from yfinance_ta_patterns.forex_data_loader import ForexDataLoader
@@ -28,3 +30,88 @@ def test_resample_to_4h():
     assert row["Low"] == 0
     assert row["Close"] == 4.4
     assert row["Volume"] == 100
+
+
+def test_download_many_splits_batch(monkeypatch):
+    idx = pd.date_range("2024-01-01 00:00", periods=3, freq="1h")
+    columns = pd.MultiIndex.from_product(
+        [["EURUSD=X", "GBPUSD=X"], ["Open", "High", "Low", "Close", "Volume"]],
+        names=["Ticker", "Price"],
+    )
+    raw = pd.DataFrame(1.0, index=idx, columns=columns)
+    raw.loc[idx[0], "GBPUSD=X"] = float("nan")
+    calls = []
+
+    def fake_download(**kwargs):
+        calls.append(kwargs)
+        return raw
+
+    monkeypatch.setattr("yfinance_ta_patterns.forex_data_loader.yf.download", fake_download)
+
+    frames = ForexDataLoader.download_many(
+        ["EURUSD", "GBPUSD=X", "USDJPY"], period="5d", interval="1h"
+    )
+
+    assert len(calls) == 1
+    assert calls[0]["tickers"] == "EURUSD=X GBPUSD=X USDJPY=X"
+    assert calls[0]["group_by"] == "ticker"
+    assert list(frames) == ["EURUSD", "GBPUSD=X", "USDJPY"]
+    assert list(frames["EURUSD"].columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert len(frames["EURUSD"]) == 3
+    assert len(frames["GBPUSD=X"]) == 2
+    assert str(frames["EURUSD"].index.tz) == "Europe/Moscow"
+    # Tickers missing from the batch come back empty but with OHLCV columns
+    assert frames["USDJPY"].empty
+    assert {"Open", "High", "Low", "Close"} <= set(frames["USDJPY"].columns)
+
+
+def test_get_data_reuses_download(monkeypatch):
+    ForexDataLoader.clear_cache()
+    idx = pd.date_range("2024-01-01 00:00", periods=3, freq="1h")
+    calls = []
+
+    def fake_download(ticker, **kwargs):
+        calls.append(ticker)
+        return pd.DataFrame({"Open": 1.0, "High": 1.0, "Low": 1.0, "Close": 1.0}, index=idx)
+
+    monkeypatch.setattr("yfinance_ta_patterns.forex_data_loader.yf.download", fake_download)
+
+    first = ForexDataLoader("EURUSD", period="5d", interval="1h").get_data()
+    second = ForexDataLoader("EURUSD=X", period="5d", interval="1h", timezone="UTC").get_data()
+    assert calls == ["EURUSD=X"]
+    assert str(first.index.tz) == "Europe/Moscow"
+    assert str(second.index.tz) == "UTC"
+
+    ForexDataLoader.clear_cache()
+    ForexDataLoader("EURUSD", period="5d", interval="1h").get_data()
+    assert calls == ["EURUSD=X", "EURUSD=X"]
+
+
+def test_process_accepts_tzinfo():
+    loader = ForexDataLoader("EURUSD", timezone=timezone(timedelta(hours=3)))
+    idx = pd.date_range("2024-01-01 00:00", periods=2, freq="1h")
+    data = loader.process(pd.DataFrame({"Close": [1.0, 2.0]}, index=idx))
+
+    assert data.index[0] == pd.Timestamp("2024-01-01 03:00", tz=timezone(timedelta(hours=3)))
+
+
+def test_get_data_does_not_cache_failed_download(monkeypatch):
+    ForexDataLoader.clear_cache()
+    idx = pd.date_range("2024-01-01 00:00", periods=3, freq="1h")
+    frames = [
+        pd.DataFrame(columns=["Open", "High", "Low", "Close"], index=pd.DatetimeIndex([])),
+        pd.DataFrame({"Open": 1.0, "High": 1.0, "Low": 1.0, "Close": 1.0}, index=idx),
+    ]
+    calls = []
+
+    def fake_download(ticker, **kwargs):
+        calls.append(ticker)
+        return frames[len(calls) - 1]
+
+    monkeypatch.setattr("yfinance_ta_patterns.forex_data_loader.yf.download", fake_download)
+
+    loader = ForexDataLoader("EURUSD", period="5d", interval="1h")
+    assert loader.get_data().empty
+    assert len(loader.get_data()) == 3
+    assert len(loader.get_data()) == 3
+    assert calls == ["EURUSD=X", "EURUSD=X"]
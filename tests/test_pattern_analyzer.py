@@ -0,0 +1,60 @@
+import pandas as pd
+
+from yfinance_ta_patterns.pattern_analyzer import PatternAnalyzer
+
+
+def test_get_signals_date_filters(make_ohlc):
+    analyzer = PatternAnalyzer(make_ohlc("2024-03-01"))
+    signals = analyzer.get_signals("engulfing")
+    assert not signals.empty
+    assert (signals != 0).all()
+    assert signals.name == "CDLENGULFING"
+
+    day = analyzer.get_signals("ENGULFING", date="2024-03-05")
+    assert not day.empty
+    assert (day.index.normalize() == pd.Timestamp("2024-03-05", tz="Europe/Moscow")).all()
+    assert day.equals(signals[signals.index.normalize() == pd.Timestamp("2024-03-05", tz="Europe/Moscow")])
+
+    ranged = analyzer.get_signals("CDLENGULFING", start_date="2024-03-04", end_date="2024-03-06")
+    days = ranged.index.normalize()
+    assert days.min() >= pd.Timestamp("2024-03-04", tz="Europe/Moscow")
+    assert days.max() == pd.Timestamp("2024-03-06", tz="Europe/Moscow")
+
+
+def test_get_signals_unknown_pattern(make_ohlc):
+    analyzer = PatternAnalyzer(make_ohlc("2024-03-01", 50))
+    try:
+        analyzer.get_signals("NOTAPATTERN")
+    except ValueError as exc:
+        assert "Unknown pattern" in str(exc)
+    else:
+        raise AssertionError("Expected ValueError for unknown pattern")
+
+
+def test_get_signals_date_filter_uses_data_timezone(make_ohlc):
+    # Same bars viewed in a fixed-offset zone: the day window follows local midnight
+    data = make_ohlc("2024-03-01").tz_convert("UTC")
+    local = data.tz_convert("Etc/GMT-5")
+    utc_day = PatternAnalyzer(data).get_signals("ENGULFING", date="2024-03-05")
+    local_day = PatternAnalyzer(local).get_signals("ENGULFING", date="2024-03-05")
+
+    assert not local_day.empty
+    assert local_day.index.min() >= pd.Timestamp("2024-03-05", tz="Etc/GMT-5")
+    assert local_day.index.max() < pd.Timestamp("2024-03-06", tz="Etc/GMT-5")
+    assert not utc_day.index.equals(local_day.index)
+
+
+def test_get_signals_without_datetime_index(make_ohlc):
+    data = make_ohlc("2024-03-01").reset_index(drop=True)
+    analyzer = PatternAnalyzer(data)
+
+    signals = analyzer.get_signals("ENGULFING")
+    assert not signals.empty
+    assert signals.index.isin(data.index).all()
+
+    try:
+        analyzer.get_signals("ENGULFING", date="2024-03-05")
+    except ValueError as exc:
+        assert "DatetimeIndex" in str(exc)
+    else:
+        raise AssertionError("Expected ValueError for date filter without DatetimeIndex")
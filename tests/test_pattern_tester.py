@@ -0,0 +1,73 @@
+import numpy as np
+
+from yfinance_ta_patterns.pattern_tester import PatternRankingTester, _simulate
+
+
+def test_simulate_opens_on_buy_and_closes_on_sell():
+    positions = np.array([0, 2, 3, 4, 5, 7])
+    signals = np.array([1, 1, -1, -1, 1, -1], dtype=np.int8)
+    closes = np.array([1.0, 2.0, 3.0, 2.0, 5.0, 4.0, 1.0, 5.0])
+
+    entry_idx, exit_idx, pnl = _simulate(positions, signals, closes, 100.0)
+
+    assert entry_idx.tolist() == [0, 5]
+    assert exit_idx.tolist() == [3, 7]
+    assert np.allclose(pnl, [100.0, 25.0])
+
+
+def test_test_all_patterns_ranked_and_news_filtered(make_ohlc, capsys):
+    tester = PatternRankingTester(make_ohlc(), news_dates=["2024-01-02", "2024-01-05"])
+
+    unfiltered = {r.pattern_name: r for r in tester.test_all_patterns()}
+    filtered = tester.test_all_patterns(filter_news=True)
+    capsys.readouterr()
+
+    assert unfiltered and filtered
+    keys = [(r.win_rate, r.total_pnl) for r in filtered]
+    assert keys == sorted(keys, reverse=True)
+    for result in filtered:
+        assert result.total_signals <= unfiltered[result.pattern_name].total_signals
+
+
+def test_comparison_report_pairs_same_pattern(make_ohlc, capsys):
+    tester = PatternRankingTester(make_ohlc(), news_dates=["2024-01-02"])
+
+    report = tester.get_comparison_report()
+    unfiltered = {r.pattern_name: r for r in tester.test_all_patterns()}
+    capsys.readouterr()
+
+    assert not report.empty
+    for _, row in report.iterrows():
+        assert row["Signals (No Filter)"] == unfiltered[row["Pattern"]].total_signals
+
+
+def test_test_all_patterns_parallel_matches_serial(make_ohlc, capsys):
+    tester = PatternRankingTester(make_ohlc(periods=500), news_dates=["2024-01-02"])
+
+    serial = tester.test_all_patterns(filter_news=True)
+    parallel = tester.test_all_patterns(filter_news=True, n_jobs=2)
+    capsys.readouterr()
+
+    assert parallel == serial
+
+
+def test_news_filter_handles_dst_jump_at_midnight(make_ohlc, capsys):
+    # Sao Paulo clocks jumped from 00:00 to 01:00 on 2018-11-04
+    data = make_ohlc("2018-11-02", periods=500, tz="America/Sao_Paulo")
+    tester = PatternRankingTester(data, news_dates=["2018-11-04"])
+    capsys.readouterr()
+
+    news_bars = data.index[tester._is_news_bar]  # noqa: SLF001
+    assert len(news_bars) == 92
+    assert (news_bars.strftime("%Y-%m-%d") == "2018-11-04").all()
+
+
+def test_test_all_patterns_rejects_invalid_n_jobs(make_ohlc):
+    tester = PatternRankingTester(make_ohlc(periods=50))
+    for n_jobs in (0, -2):
+        try:
+            tester.test_all_patterns(n_jobs=n_jobs)
+        except ValueError as exc:
+            assert "n_jobs" in str(exc)
+        else:
+            raise AssertionError(f"Expected ValueError for n_jobs={n_jobs}")
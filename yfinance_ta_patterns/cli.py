@@ -1,4 +1,8 @@
 import argparse
+import sys
+from typing import Dict, List
+
+import pandas as pd
 
 from .forex_data_loader import ForexDataLoader
 from .pattern_analyzer import PatternAnalyzer
@@ -53,13 +57,19 @@ def parse_args() -> argparse.Namespace:
             "  python main.py --all-patterns --symbol EURUSD --timeframe 5m --period 60d "
             "--start-date 2025-04-01 --end-date 2025-04-10\n\n"
             "  # Single pattern without date filter\n"
-            "  python main.py --pattern KICKING --symbol EURUSD --timeframe 5m --period 60d\n"
+            "  python main.py --pattern KICKING --symbol EURUSD --timeframe 5m --period 60d\n\n"
+            "  # All patterns for several symbols (downloaded in one batch)\n"
+            "  python main.py --all-patterns --symbol EURUSD GBPUSD USDJPY --timeframe 1h --period 60d\n"
         ),
     )
     parser.add_argument(
         "--symbol",
-        default="EURUSD",
-        help="Ticker without suffix (e.g. EURUSD, GBPUSD); '=X' will be appended automatically.",
+        nargs="+",
+        default=["EURUSD"],
+        help=(
+            "One or more tickers without suffix (e.g. EURUSD GBPUSD); "
+            "'=X' will be appended automatically."
+        ),
     )
     parser.add_argument("--period", default="60d", help="History period, e.g. 60d")
     parser.add_argument(
@@ -95,55 +105,50 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def main() -> None:
-    args = parse_args()
-    interval = normalize_timeframe(args.timeframe)
+def write_signals(signals: pd.Series) -> None:
+    """Write signals to stdout without an intermediate print() copy of the text."""
+    signals.to_string(buf=sys.stdout)
+    sys.stdout.write("\n")
 
-    if args.date and (args.start_date or args.end_date):
-        raise ValueError("Use either --date or --start-date/--end-date, not both.")
 
-    data = ForexDataLoader(
-        args.symbol,
-        period=args.period,
-        interval=interval,
-    ).get_data()
+def load_data(symbols: List[str], period: str, interval: str) -> Dict[str, pd.DataFrame]:
+    """Fetch data per symbol, batching the download when several are requested."""
+    if len(symbols) == 1:
+        symbol = symbols[0]
+        return {symbol: ForexDataLoader(symbol, period=period, interval=interval).get_data()}
+    return ForexDataLoader.download_many(symbols, period=period, interval=interval)
+
 
+def report_symbol(
+    symbol: str, data: pd.DataFrame, args: argparse.Namespace, interval: str, range_info: str
+) -> None:
+    """Print pattern signals for a single symbol."""
     analyzer = PatternAnalyzer(data)
-    range_info = ""
-    if args.date:
-        range_info = f" on {args.date}"
-    elif args.start_date or args.end_date:
-        range_info = f" from {args.start_date or 'beginning'} to {args.end_date or 'end'}"
+    # Parse the date filters once instead of once per pattern
+    dates = analyzer.normalize_dates(args.date, args.start_date, args.end_date)
 
     if args.pattern:
-        signals = analyzer.get_signals(
-            args.pattern,
-            date=args.date,
-            start_date=args.start_date,
-            end_date=args.end_date,
-        )
+        signals = analyzer.get_signals_for_dates(args.pattern, *dates)
 
         if signals.empty:
             print(
-                f"No signals for pattern {args.pattern} "
+                f"No signals for pattern {args.pattern} ({symbol}) "
                 f"on period {args.period} timeframe {interval}{range_info}"
             )
         else:
-            print(f"Found signals for {args.pattern} ({interval}, {args.period}){range_info}:")
-            print(signals.to_string())
+            print(
+                f"Found signals for {args.pattern} "
+                f"({symbol}, {interval}, {args.period}){range_info}:"
+            )
+            write_signals(signals)
     else:
         print(
-            f"Scanning all patterns for {args.symbol} "
+            f"Scanning all patterns for {symbol} "
             f"({interval}, {args.period}){range_info}..."
         )
         found_any = False
-        for pattern in sorted(analyzer.pattern_functions):
-            signals = analyzer.get_signals(
-                pattern,
-                date=args.date,
-                start_date=args.start_date,
-                end_date=args.end_date,
-            )
+        for pattern in analyzer.pattern_functions:
+            signals = analyzer.get_signals_for_dates(pattern, *dates)
             pattern_name = pattern.replace("CDL", "")
             if signals.empty:
                 print(f"{pattern_name}: no signals")
@@ -151,15 +156,32 @@ def main() -> None:
 
             found_any = True
             print(f"{pattern_name}:")
-            print(signals.to_string())
+            write_signals(signals)
             print("-" * 40)
 
         if not found_any:
             print(
-                f"No signals for any pattern on period {args.period} "
+                f"No signals for any pattern ({symbol}) on period {args.period} "
                 f"timeframe {interval}{range_info}"
             )
 
 
+def main() -> None:
+    args = parse_args()
+    interval = normalize_timeframe(args.timeframe)
+
+    if args.date and (args.start_date or args.end_date):
+        raise ValueError("Use either --date or --start-date/--end-date, not both.")
+
+    range_info = ""
+    if args.date:
+        range_info = f" on {args.date}"
+    elif args.start_date or args.end_date:
+        range_info = f" from {args.start_date or 'beginning'} to {args.end_date or 'end'}"
+
+    for symbol, data in load_data(args.symbol, args.period, interval).items():
+        report_symbol(symbol, data, args, interval, range_info)
+
+
 if __name__ == "__main__":
     main()
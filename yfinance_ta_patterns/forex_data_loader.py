@@ -1,7 +1,29 @@
+from collections import OrderedDict
+from datetime import tzinfo
+from types import MappingProxyType
+from typing import Dict, Iterable, Tuple, Union
+
 import pandas as pd
 import yfinance as yf
 import pytz
 
+
+# Aggregation used when resampling standard yfinance OHLCV columns
+_OHLCV_AGG = MappingProxyType({
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Adj Close": "last",
+    "Volume": "sum",
+})
+
+
+# Raw downloads per (ticker, period, download interval), least recently used first
+_FETCH_CACHE_SIZE = 32
+_fetch_cache: "OrderedDict[Tuple[str, str, str], pd.DataFrame]" = OrderedDict()
+
+
 class ForexDataLoader:
     """
     Generic Data Loader for Yahoo Finance tickers (forex, stocks, crypto, etc.).
@@ -12,64 +34,124 @@ class ForexDataLoader:
         symbol: str,
         period: str = '60d',
         interval: str = '15m',
-        timezone: str = 'Europe/Moscow'
+        timezone: Union[str, tzinfo] = 'Europe/Moscow'
     ):
         # Allow full tickers or append suffix if missing
         self.ticker = symbol if symbol.endswith(suffix := '=X') else f"{symbol}{suffix}"
         self.period = period
         self.interval = interval
         self.timezone = timezone
+        # tzinfo objects (e.g. fixed offsets without DST rules) are used as-is
+        self._tz = pytz.timezone(timezone) if isinstance(timezone, str) else timezone
         self._download_interval = self._resolve_download_interval(interval)
         self._resample_rule = "4h" if interval == "4h" else None
+        self._resampler_kwargs = {"rule": self._resample_rule, "label": "left", "closed": "left"}
 
-    def _resolve_download_interval(self, interval: str) -> str:
+    @staticmethod
+    def _resolve_download_interval(interval: str) -> str:
         """Map custom intervals to supported yfinance intervals."""
         if interval == "4h":
             return "1h"  # fetch 1h data and resample to 4h
         return interval
 
     def fetch(self) -> pd.DataFrame:
-        """Fetch raw data via yfinance."""
-        return yf.download(
-            self.ticker,
-            period=self.period,
-            interval=self._download_interval,
+        """Fetch raw data via yfinance, reusing earlier downloads in this process."""
+        key = (self.ticker, self.period, self._download_interval)
+        data = _fetch_cache.get(key)
+        if data is None:
+            data = yf.download(
+                self.ticker,
+                period=self.period,
+                interval=self._download_interval,
+                auto_adjust=True
+            )
+            # yfinance reports failures as an empty frame; don't cache those
+            # so a later call retries the download
+            if data.empty:
+                return data
+            _fetch_cache[key] = data
+            if len(_fetch_cache) > _FETCH_CACHE_SIZE:
+                _fetch_cache.popitem(last=False)
+        else:
+            _fetch_cache.move_to_end(key)
+        # Copy so processing never mutates the cached frame
+        return data.copy()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop memoized downloads (tests that patch yfinance should call this first)."""
+        _fetch_cache.clear()
+
+    @classmethod
+    def download_many(
+        cls,
+        symbols: Iterable[str],
+        period: str = '60d',
+        interval: str = '15m',
+        timezone: Union[str, tzinfo] = 'Europe/Moscow'
+    ) -> Dict[str, pd.DataFrame]:
+        """Fetch several symbols in one threaded yfinance batch.
+
+        Returns processed (and resampled, if needed) frames keyed by the
+        symbol as passed in.
+        """
+        loaders = {
+            symbol: cls(symbol, period=period, interval=interval, timezone=timezone)
+            for symbol in symbols
+        }
+        if not loaders:
+            return {}
+
+        tickers = list(dict.fromkeys(loader.ticker for loader in loaders.values()))
+        raw = yf.download(
+            tickers=" ".join(tickers),
+            period=period,
+            interval=cls._resolve_download_interval(interval),
+            threads=True,
+            group_by='ticker',
             auto_adjust=True
         )
 
+        available = set(raw.columns.get_level_values(0))
+        result = {}
+        for symbol, loader in loaders.items():
+            # Tickers are aligned on a shared index; drop rows of other tickers
+            frame = (
+                raw[loader.ticker].dropna(how='all')
+                if loader.ticker in available
+                else pd.DataFrame(columns=list(_OHLCV_AGG), index=raw.index[:0], dtype=float)
+            )
+            result[symbol] = loader._resample_if_needed(loader.process(frame))
+        return result
+
     def _resample_if_needed(self, data: pd.DataFrame) -> pd.DataFrame:
         """Resample OHLCV data when the requested interval is not natively supported."""
         if not self._resample_rule or data.empty:
             return data
 
-        agg = {
-            "Open": "first",
-            "High": "max",
-            "Low": "min",
-            "Close": "last",
-        }
-        if "Adj Close" in data.columns:
-            agg["Adj Close"] = "last"
-        if "Volume" in data.columns:
-            agg["Volume"] = "sum"
-        # Keep any other columns by taking the last value in the window
-        for col in data.columns:
-            if col not in agg:
-                agg[col] = "last"
+        columns = set(data.columns)
+        agg = {col: how for col, how in _OHLCV_AGG.items() if col in columns}
+        if len(agg) < len(columns):
+            # Keep any other columns by taking the last value in the window
+            agg.update((col, "last") for col in data.columns if col not in agg)
 
-        return data.resample(self._resample_rule).agg(agg).dropna()
+        return data.resample(**self._resampler_kwargs).agg(agg).dropna()
 
     def process(self, data: pd.DataFrame) -> pd.DataFrame:
         """Normalize columns and timezone."""
         # Drop extra MultiIndex level if present
-        data.columns = data.columns.droplevel(1) if data.columns.nlevels > 1 else data.columns
+        if isinstance(data.columns, pd.MultiIndex):
+            data.columns = data.columns.droplevel(1)
 
-        if data.index.tz is None:
-            data.index = data.index.tz_localize(pytz.UTC)
-        else:
-            data.index = data.index.tz_convert(pytz.UTC)
-        # Потом конвертируем в нужную зону
-        data.index = data.index.tz_convert(self.timezone)
+        # yfinance returns UTC-aware indexes, so usually a single conversion
+        # into the target zone is all that is needed
+        index = data.index
+        if index.tz is None:
+            index = index.tz_localize(pytz.UTC)
+        if str(index.tz) != str(self._tz):
+            index = index.tz_convert(self._tz)
+        if index is not data.index:
+            data.index = index
         return data
 
     def get_data(self) -> pd.DataFrame:
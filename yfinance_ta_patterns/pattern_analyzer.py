@@ -1,26 +1,65 @@
+from functools import lru_cache
 from typing import Iterable, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import talib
 
+# Catalog of TA-Lib candlestick detectors, built once at import time
+_CDL_PATTERNS = tuple(sorted(f for f in dir(talib) if f.startswith("CDL")))
+_CDL_FUNCS = {name: getattr(talib, name) for name in _CDL_PATTERNS}
+
+
+def _ohlc_buffer(data: pd.DataFrame) -> np.ndarray:
+    """Pack Open/High/Low/Close into one (4, N) float64 array.
+
+    Each row is a contiguous view that TA-Lib accepts without copying, and the
+    four series share a single allocation scanned by every pattern.
+    """
+    ohlc = np.empty((4, len(data)), dtype=np.float64)
+    for row, column in zip(ohlc, ("Open", "High", "Low", "Close")):
+        row[:] = data[column].to_numpy(np.float64)
+    return ohlc
+
 
 class PatternAnalyzer:
     def __init__(self, data: pd.DataFrame):
         self.data = data
-        self.pattern_functions = [f for f in dir(talib) if f.startswith("CDL")]
+        # Contiguous float64 inputs for TA-Lib, shared by every pattern call
+        self._open, self._high, self._low, self._close = _ohlc_buffer(data)
+        # Bar times as int64 nanoseconds, built on the first date filter
+        self._times: Optional[np.ndarray] = None
+        self.pattern_functions = _CDL_PATTERNS
 
-    def _normalize_pattern(self, pattern: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _normalize_pattern(pattern: str) -> str:
         pattern_upper = pattern.upper()
         return pattern_upper if pattern_upper.startswith("CDL") else f"CDL{pattern_upper}"
 
-    def _normalize_dates(
+    def _datetime_index(self) -> pd.DatetimeIndex:
+        index = self.data.index
+        if not isinstance(index, pd.DatetimeIndex):
+            raise ValueError(
+                f"Date filters require a DatetimeIndex, got {type(index).__name__}"
+            )
+        return index
+
+    def _bar_times(self) -> np.ndarray:
+        """Bar times as int64 nanoseconds (UTC for tz-aware indexes)."""
+        if self._times is None:
+            self._times = self._datetime_index().asi8
+        return self._times
+
+    def normalize_dates(
         self, date: Optional[str], start_date: Optional[str], end_date: Optional[str]
     ) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp], Optional[pd.Timestamp]]:
-        tz = self.data.index.tz
+        """Parse date filters into day starts in the data's timezone."""
 
         def convert(dt: Optional[str]) -> Optional[pd.Timestamp]:
             if dt is None:
                 return None
+            tz = self._datetime_index().tz
             parsed = pd.to_datetime(dt)
             if parsed.tzinfo is None:
                 parsed = parsed.tz_localize(tz)
@@ -38,49 +77,52 @@ class PatternAnalyzer:
         end_date: Optional[str] = None,
     ) -> pd.Series:
         """Return non-zero signals for a single candlestick pattern with optional date filters."""
+        return self.get_signals_for_dates(
+            pattern, *self.normalize_dates(date, start_date, end_date)
+        )
+
+    def get_signals_for_dates(
+        self,
+        pattern: str,
+        target_date: Optional[pd.Timestamp] = None,
+        start_dt: Optional[pd.Timestamp] = None,
+        end_dt: Optional[pd.Timestamp] = None,
+    ) -> pd.Series:
+        """Like get_signals, but with date filters already parsed by normalize_dates."""
         normalized = self._normalize_pattern(pattern)
-        if normalized not in self.pattern_functions:
+        pattern_func = _CDL_FUNCS.get(normalized)
+        if pattern_func is None:
             available = ", ".join(p.replace("CDL", "") for p in self.pattern_functions)
             raise ValueError(f"Unknown pattern '{pattern}'. Available: {available}")
 
-        pattern_func = getattr(talib, normalized)
-        result = pattern_func(
-            self.data["Open"],
-            self.data["High"],
-            self.data["Low"],
-            self.data["Close"],
-        )
-        series = pd.Series(result, index=self.data.index, name=normalized)
-        signals = series[series != 0]
-
-        target_date, start_dt, end_dt = self._normalize_dates(date, start_date, end_date)
-
-        if target_date:
-            day_index = signals.index.normalize()
-            signals = signals[day_index == target_date]
+        result = pattern_func(self._open, self._high, self._low, self._close)
+        positions = np.flatnonzero(result)
 
-        if start_dt or end_dt:
-            day_index = signals.index.normalize()
-            mask = pd.Series(True, index=signals.index)
+        # Bar times are sorted, so each day filter is a positional slice
+        if target_date or start_dt or end_dt:
+            next_day = pd.DateOffset(days=1)
+            times = self._bar_times()[positions]
+            lo, hi = 0, len(positions)
+            if target_date:
+                lo = max(lo, times.searchsorted(target_date.value))
+                hi = min(hi, times.searchsorted((target_date + next_day).value))
             if start_dt:
-                mask &= day_index >= start_dt
+                lo = max(lo, times.searchsorted(start_dt.value))
             if end_dt:
-                mask &= day_index <= end_dt
-            signals = signals[mask]
+                hi = min(hi, times.searchsorted((end_dt + next_day).value))
+            positions = positions[lo:hi]
 
-        return signals
+        return pd.Series(result[positions], index=self.data.index[positions], name=normalized)
 
     def analyze_all_for_date(self, date: str) -> Iterable[str]:
         """Keep legacy all-patterns behavior for a specific date."""
         messages = []
         for pattern in self.pattern_functions:
-            pattern_func = getattr(talib, pattern)
+            pattern_func = _CDL_FUNCS[pattern]
             try:
-                result = pattern_func(
-                    self.data["Open"],
-                    self.data["High"],
-                    self.data["Low"],
-                    self.data["Close"],
+                result = pd.Series(
+                    pattern_func(self._open, self._high, self._low, self._close),
+                    index=self.data.index,
                 )
                 values = result.loc[date]
                 values_series = (
@@ -2,11 +2,64 @@
 
 import pandas as pd
 import numpy as np
-import talib
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from utils.pattern_helper import PatternHelper
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from .pattern_analyzer import _CDL_FUNCS, _CDL_PATTERNS, _ohlc_buffer
+
+try:
+    from numba import njit
+    _PY_FALLBACK = False
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    _PY_FALLBACK = True
+
+
+def _simulate_py(
+    positions: np.ndarray,
+    signals: np.ndarray,
+    closes: np.ndarray,
+    position_size: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Walk the non-zero signals once and return (entry_idx, exit_idx, pnl) for
+    completed trades; `signals[k]` is the signal at bar `positions[k]`.
+    
+    Opens a long position on a 1 signal when flat and closes it on the next -1.
+    """
+    n = positions.shape[0]
+    entry_out = np.empty(n, np.int64)
+    exit_out = np.empty(n, np.int64)
+    pnl_out = np.empty(n, np.float64)
+    k = 0
+    position = 0.0
+    entry_idx = -1
+    
+    for j in range(n):
+        i = positions[j]
+        signal = signals[j]
+        
+        # BUY signal
+        if signal == 1 and position == 0.0:
+            entry_idx = i
+            position = position_size / closes[i]
+        
+        # SELL signal
+        elif signal == -1 and position > 0.0 and entry_idx >= 0:
+            entry_out[k] = entry_idx
+            exit_out[k] = i
+            pnl_out[k] = position * (closes[i] - closes[entry_idx])
+            k += 1
+            
+            position = 0.0
+            entry_idx = -1
+    
+    return entry_out[:k], exit_out[:k], pnl_out[:k]
+
+
+_simulate = _simulate_py if _PY_FALLBACK else njit(cache=True)(_simulate_py)
 
 
 @dataclass
@@ -24,13 +77,26 @@ class PatternResult:
     sharpe_ratio: float
 
 
+@dataclass
+class TradeArrays:
+    """Completed trades of a single pattern, one array per field."""
+    entry_time: pd.DatetimeIndex
+    exit_time: pd.DatetimeIndex
+    entry_price: np.ndarray
+    exit_price: np.ndarray
+    pnl: np.ndarray
+
+
 class PatternRankingTester:
     """
     Test all candlestick patterns and rank them by performance.
     Can filter by economic news events.
     """
     
-    __slots__ = ('_data', '_initial_capital', '_position_size', '_results', '_news_dates')
+    __slots__ = (
+        '_data', '_initial_capital', '_position_size', '_results', '_is_news_bar',
+        '_o', '_h', '_l', '_c', '_detection_cache'
+    )
     
     def __init__(
         self,
@@ -54,12 +120,28 @@ class PatternRankingTester:
             List of dates with important news (YYYY-MM-DD)
         """
         self._data = data
+        # Contiguous float64 inputs for TA-Lib, shared by every pattern call
+        self._o, self._h, self._l, self._c = _ohlc_buffer(data)
         self._initial_capital = initial_capital
         self._position_size = position_size
         self._results: List[PatternResult] = []
-        self._news_dates = set(news_dates) if news_dates else set()
+        # Pattern detection does not depend on the news filter; cache it per
+        # pattern name for the lifetime of this tester (bound to `data`)
+        self._detection_cache: Dict[str, np.ndarray] = {}
+        # Boolean mask of bars falling on a news day, computed once
+        self._is_news_bar: Optional[np.ndarray] = None
+        if news_dates:
+            # Compare local wall-clock days; localizing midnights would fail on
+            # days that start with a DST jump
+            index = data.index
+            days = (index.tz_localize(None) if index.tz is not None else index).normalize()
+            self._is_news_bar = np.asarray(days.isin(pd.to_datetime(list(news_dates))))
     
-    def test_all_patterns(self, filter_news: bool = False) -> List[PatternResult]:
+    def test_all_patterns(
+        self,
+        filter_news: bool = False,
+        n_jobs: int = 1
+    ) -> List[PatternResult]:
         """
         Test all patterns and return ranked results.
         
@@ -67,144 +149,152 @@ class PatternRankingTester:
         -----------
         filter_news : bool
             If True, exclude trades during news events
+        n_jobs : int
+            Number of worker processes: 1 runs in-process, a larger number
+            uses that many processes and -1 uses all cores
         
         Returns:
         --------
         list : Ranked pattern results
         """
-        self._results = []
+        if n_jobs != -1 and n_jobs < 1:
+            raise ValueError(f"n_jobs must be -1 or a positive integer, got {n_jobs}")
         
-        # Get all patterns dynamically from TA-Lib
-        all_patterns = PatternHelper.get_all_patterns()
+        if n_jobs == 1:
+            results = [self._test_pattern_safely(p, filter_news) for p in _CDL_PATTERNS]
+        else:
+            # TA-Lib holds the GIL, so patterns are spread across processes
+            with ProcessPoolExecutor(
+                max_workers=None if n_jobs == -1 else n_jobs,
+                initializer=_init_worker,
+                initargs=(self,)
+            ) as executor:
+                results = list(executor.map(
+                    _test_pattern_in_worker, _CDL_PATTERNS, repeat(filter_news)
+                ))
         
-        for pattern_name in all_patterns:
-            try:
-                result = self._test_single_pattern(pattern_name, filter_news)
-                if result and result.total_signals > 0:
-                    self._results.append(result)
-            except Exception as e:
-                print(f"Error testing {pattern_name}: {e}")
-                continue
-        
-        # Sort by win rate, then by total PnL
-        self._results.sort(key=lambda x: (x.win_rate, x.total_pnl), reverse=True)
+        self._results = [r for r in results if r and r.total_signals > 0]
+        self._rank(self._results)
         
         return self._results
     
-    def _test_single_pattern(
+    def _test_pattern_safely(
         self,
         pattern_name: str,
         filter_news: bool
     ) -> Optional[PatternResult]:
-        """Test a single pattern."""
-        # Detect pattern
-        pattern_func = getattr(talib, pattern_name, None)
+        """Test a single pattern, reporting errors instead of raising."""
+        try:
+            return self._test_single_pattern(pattern_name, filter_news)
+        except Exception as e:
+            print(f"Error testing {pattern_name}: {e}")
+            return None
+    
+    @staticmethod
+    def _rank(results: List[PatternResult]) -> None:
+        """Sort results in place by win rate, then by total PnL."""
+        results.sort(key=lambda x: (x.win_rate, x.total_pnl), reverse=True)
+    
+    def _detect(self, pattern_name: str) -> Optional[np.ndarray]:
+        """Run a TA-Lib pattern detector once and cache its output."""
+        cached = self._detection_cache.get(pattern_name)
+        if cached is not None:
+            return cached
+        
+        pattern_func = _CDL_FUNCS.get(pattern_name)
         if not pattern_func:
             print(f"Pattern function not found: {pattern_name}")
             return None
         
         try:
-            pattern_values = pattern_func(
-                self._data['Open'].values,
-                self._data['High'].values,
-                self._data['Low'].values,
-                self._data['Close'].values
-            )
+            pattern_values = pattern_func(self._o, self._h, self._l, self._c)
         except Exception as e:
             print(f"Error detecting pattern {pattern_name}: {e}")
             return None
         
-        # Generate signals
-        signals = np.zeros(len(self._data))
-        for i in range(len(pattern_values)):
-            if pattern_values[i] > 0:  # Bullish pattern
-                signals[i] = 1
-            elif pattern_values[i] < 0:  # Bearish pattern
-                signals[i] = -1
+        self._detection_cache[pattern_name] = pattern_values
+        return pattern_values
+    
+    def _test_single_pattern(
+        self,
+        pattern_name: str,
+        filter_news: bool
+    ) -> Optional[PatternResult]:
+        """Test a single pattern."""
+        pattern_values = self._detect(pattern_name)
+        if pattern_values is None:
+            return None
+        return self._score(pattern_name, pattern_values, filter_news)
+    
+    def _score(
+        self,
+        pattern_name: str,
+        pattern_values: np.ndarray,
+        filter_news: bool
+    ) -> Optional[PatternResult]:
+        """Backtest precomputed pattern values and build the result."""
+        # Bars with a pattern hit; most patterns fire rarely, so work sparsely
+        positions = np.flatnonzero(pattern_values)
         
         # Filter by news if requested
-        if filter_news and self._news_dates:
-            for i in range(len(signals)):
-                date_str = self._data.index[i].strftime('%Y-%m-%d')
-                if date_str in self._news_dates:
-                    signals[i] = 0
+        if filter_news and self._is_news_bar is not None:
+            positions = positions[~self._is_news_bar[positions]]
+        
+        total_signals = int(positions.size)
+        if total_signals == 0:
+            print(f"{pattern_name}: No signals generated")
+            return None
+        
+        # Generate signals: 1 for bullish, -1 for bearish
+        signals = np.sign(pattern_values[positions]).astype(np.int8)
         
         # Calculate trades
-        trades = self._calculate_trades(signals)
+        trades = self._calculate_trades(positions, signals)
         
-        # Return None if no trades or too few signals
-        if not trades:
-            # Check if there were any signals at all
-            total_signals = int(np.sum(signals != 0))
-            if total_signals == 0:
-                print(f"{pattern_name}: No signals generated")
-            else:
-                print(f"{pattern_name}: {total_signals} signals but no completed trades")
+        # Return None if no completed trades
+        pnl = trades.pnl
+        if pnl.size == 0:
+            print(f"{pattern_name}: {total_signals} signals but no completed trades")
             return None
         
         # Calculate statistics
-        winning_trades = [t for t in trades if t['pnl'] > 0]
-        losing_trades = [t for t in trades if t['pnl'] <= 0]
+        n_trades = pnl.size
+        winning_trades = int(np.count_nonzero(pnl > 0))
         
-        total_pnl = sum(t['pnl'] for t in trades)
-        avg_pnl = total_pnl / len(trades) if trades else 0
-        win_rate = len(winning_trades) / len(trades) * 100 if trades else 0
-        
-        max_profit = max([t['pnl'] for t in trades]) if trades else 0
-        max_loss = min([t['pnl'] for t in trades]) if trades else 0
+        total_pnl = float(pnl.sum())
+        avg_pnl = total_pnl / n_trades
+        win_rate = winning_trades / n_trades * 100
         
         # Calculate Sharpe ratio
-        pnls = [t['pnl'] for t in trades]
-        sharpe = (np.mean(pnls) / np.std(pnls)) * np.sqrt(252) if len(pnls) > 1 and np.std(pnls) > 0 else 0
+        std = float(pnl.std())
+        sharpe = float(pnl.mean() / std * np.sqrt(252)) if n_trades > 1 and std > 0 else 0.0
         
         return PatternResult(
             pattern_name=pattern_name.replace('CDL', ''),
-            total_signals=int(np.sum(signals != 0)),
-            winning_trades=len(winning_trades),
-            losing_trades=len(losing_trades),
+            total_signals=total_signals,
+            winning_trades=winning_trades,
+            losing_trades=n_trades - winning_trades,
             win_rate=win_rate,
             total_pnl=total_pnl,
             avg_pnl=avg_pnl,
-            max_profit=max_profit,
-            max_loss=max_loss,
+            max_profit=float(pnl.max()),
+            max_loss=float(pnl.min()),
             sharpe_ratio=sharpe
         )
     
-    def _calculate_trades(self, signals: np.ndarray) -> List[Dict]:
-        """Calculate trades from signals."""
-        trades = []
-        position = 0
-        entry_idx = None
-        
-        closes = self._data['Close'].values
-        times = self._data.index.to_numpy()
-        
-        for i in range(len(signals)):
-            signal = signals[i]
-            
-            # BUY signal
-            if signal == 1 and position == 0:
-                entry_idx = i
-                position = self._position_size / closes[i]
-            
-            # SELL signal
-            elif signal == -1 and position > 0 and entry_idx is not None:
-                exit_price = closes[i]
-                entry_price = closes[entry_idx]
-                pnl = position * (exit_price - entry_price)
-                
-                trades.append({
-                    'entry_time': times[entry_idx],
-                    'exit_time': times[i],
-                    'entry_price': entry_price,
-                    'exit_price': exit_price,
-                    'pnl': pnl
-                })
-                
-                position = 0
-                entry_idx = None
+    def _calculate_trades(self, positions: np.ndarray, signals: np.ndarray) -> TradeArrays:
+        """Calculate trades from the signals at the given bar positions."""
+        entry_idx, exit_idx, pnl = _simulate(
+            positions, signals, self._c, float(self._position_size)
+        )
         
-        return trades
+        return TradeArrays(
+            entry_time=self._data.index[entry_idx],
+            exit_time=self._data.index[exit_idx],
+            entry_price=self._c[entry_idx],
+            exit_price=self._c[exit_idx],
+            pnl=pnl
+        )
     
     def get_top_patterns(self, n: int = 10) -> List[PatternResult]:
         """Get top N patterns by performance."""
@@ -212,15 +302,39 @@ class PatternRankingTester:
     
     def get_comparison_report(self) -> pd.DataFrame:
         """Get comparison report with/without news filter."""
-        # Test without news filter
-        results_no_filter = self.test_all_patterns(filter_news=False)
+        results_no_filter = []
+        results_with_filter = []
+        pairs = {}
+        
+        # Detect each pattern once and score it with and without the filter
+        for pattern_name in _CDL_PATTERNS:
+            try:
+                pattern_values = self._detect(pattern_name)
+                if pattern_values is None:
+                    continue
+                r_no = self._score(pattern_name, pattern_values, False)
+                r_yes = self._score(pattern_name, pattern_values, True)
+            except Exception as e:
+                print(f"Error testing {pattern_name}: {e}")
+                continue
+            
+            if r_no and r_no.total_signals > 0:
+                results_no_filter.append(r_no)
+            if r_yes and r_yes.total_signals > 0:
+                results_with_filter.append(r_yes)
+                if r_no and r_no.total_signals > 0:
+                    pairs[r_no.pattern_name] = r_yes
         
-        # Test with news filter
-        results_with_filter = self.test_all_patterns(filter_news=True)
+        self._rank(results_no_filter)
+        self._rank(results_with_filter)
+        self._results = results_with_filter
         
-        # Create comparison DataFrame
+        # Create comparison DataFrame, ranked by the unfiltered results
         data = []
-        for r_no, r_yes in zip(results_no_filter[:20], results_with_filter[:20]):
+        for r_no in results_no_filter:
+            r_yes = pairs.get(r_no.pattern_name)
+            if r_yes is None:
+                continue
             data.append({
                 'Pattern': r_no.pattern_name,
                 'Win Rate (No News Filter)': f"{r_no.win_rate:.1f}%",
@@ -232,6 +346,8 @@ class PatternRankingTester:
                 'Sharpe (No Filter)': f"{r_no.sharpe_ratio:.2f}",
                 'Sharpe (With Filter)': f"{r_yes.sharpe_ratio:.2f}"
             })
+            if len(data) == 20:
+                break
         
         return pd.DataFrame(data)
     
@@ -256,3 +372,19 @@ class PatternRankingTester:
         df = pd.DataFrame(data)
         df.to_csv(filename, index=False)
         print(f"Results exported to {filename}")
+
+
+# Tester copy held by each worker process of a parallel sweep
+_worker_tester: Optional[PatternRankingTester] = None
+
+
+def _init_worker(tester: PatternRankingTester) -> None:
+    global _worker_tester
+    _worker_tester = tester
+
+
+def _test_pattern_in_worker(
+    pattern_name: str,
+    filter_news: bool
+) -> Optional[PatternResult]:
+    return _worker_tester._test_pattern_safely(pattern_name, filter_news)